@@ -36,7 +36,7 @@ class TestAutomationFramework:
     def load_test_plan(self, plan_path):
         """Load and validate a test plan JSON file."""
         try:
-            with open(plan_path, 'r') as f:
+            with open(plan_path, 'r', encoding='utf-8') as f:
                 plan = json.load(f)
             
             # Validate required fields
@@ -26,7 +26,7 @@ class TmpAreaManager:
         """Load configuration from global.json and variables.json."""
         try:
             config_path = os.path.join(os.path.dirname(__file__), '..', 'configs', 'global.json')
-            with open(config_path, 'r') as f:
+            with open(config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
             
             self.linux_tmp_path = config['tmp']['linux_tmp_path']
@@ -47,7 +47,7 @@ class TmpAreaManager:
         try:
             variables_path = os.path.join(os.path.dirname(__file__), '..', 'configs', 'variables.json')
             if os.path.exists(variables_path):
-                with open(variables_path, 'r') as f:
+                with open(variables_path, 'r', encoding='utf-8') as f:
                     self.variables = json.load(f)
             else:
                 print(f"Warning: Variables file not found at {variables_path}")
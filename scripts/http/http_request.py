@@ -5,11 +5,157 @@ This script provides a comprehensive HTTP request function supporting multiple a
 custom headers, request body, proxy configuration, and SSL certificate verification.
 """
 
+import json
 import os
 import sys
-import json
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import timedelta
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, NewConnectionError
+from urllib3.util.retry import Retry
+
+class _ConnectRetry(Retry):
+    """
+    Retry policy that gives up at once on a connection timeout: retrying it would
+    multiply the step timeout, while the error still reports the single timeout.
+    """
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # NewConnectionError (refused, unreachable...) subclasses ConnectTimeoutError
+        if isinstance(error, ConnectTimeoutError) and not isinstance(error, NewConnectionError):
+            raise MaxRetryError(_pool, url, error) from error
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+# Shared session so consecutive requests reuse pooled keep-alive connections
+# (TCP and TLS handshakes are only paid once per host).
+# Pools are sized for concurrent callers; keep pool_maxsize well below 1000,
+# larger pools degrade instead of helping. Only failed connection attempts that did
+# not time out (refused or reset) are retried, with a short exponential backoff:
+# the request never reached the server.
+# Responses are never retried, whatever their status or Retry-After header: the
+# status is what the test step checks, and a retry would send the request to the
+# system under test again.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=100,
+    max_retries=_ConnectRetry(
+        total=2,
+        connect=2,
+        read=0,
+        backoff_factor=0.2,
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+# Validators of previous unauthenticated GET responses, used to send conditional
+# requests: (url, request headers) -> (etag, last_modified, body, status_code), in LRU order.
+# The request headers are part of the key: a response only stands for requests
+# sent with the same headers (Accept, Accept-Language, ...)
+_CACHE = OrderedDict()
+_CACHE_MAX_ENTRIES = 128
+
+def _cache_key(url, headers=None):
+    """Build the cache key of a GET request from its URL and normalized headers."""
+    if not headers:
+        return (url, ())
+    return (url, tuple(sorted((str(name).lower(), str(value)) for name, value in headers.items())))
+
+def _conditional_headers(cached):
+    """Build the validator headers used to revalidate a cached response."""
+    headers = {}
+    if cached[0]:
+        headers['If-None-Match'] = cached[0]
+    if cached[1]:
+        headers['If-Modified-Since'] = cached[1]
+    return headers
+
+def _json_default(obj):
+    """Serialize the response objects the json module does not handle natively."""
+    if isinstance(obj, Mapping):
+        # response.headers (CaseInsensitiveDict) is only copied when encoded
+        return dict(obj)
+    if isinstance(obj, timedelta):
+        return str(obj)
+    raise TypeError
+
+def _send(method, url, **request_params):
+    """Send a request through the shared session."""
+    try:
+        return _SESSION.request(method, url, **request_params)
+    finally:
+        # Do not leak cookies from one test step to the next
+        _SESSION.cookies.clear()
+
+def _format_response(result, response, expected_status, cache_key=None, cached=None):
+    """
+    Fill the standardized result structure from an HTTP response.
+    
+    Args:
+        result (dict): Standardized result structure to fill
+        response (requests.Response): Response to report
+        expected_status (int/list): Expected HTTP status code(s)
+        cache_key (tuple, optional): Cache key when the response validators may be cached
+        cached (tuple, optional): Cache entry the request was revalidating
+        
+    Returns:
+        dict: The filled result structure
+    """
+    revalidated = cached is not None and response.status_code == 304
+    if revalidated:
+        # Not modified: serve the body of the cached response
+        _CACHE.move_to_end(cache_key)
+        status_code = cached[3]
+        response_body = cached[2]
+    else:
+        status_code = response.status_code
+        # Try to parse response content
+        try:
+            response_body = response.json()
+        except:
+            response_body = response.text
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if cache_key and status_code == 200 and (etag or last_modified):
+            _CACHE[cache_key] = (etag, last_modified, response_body, status_code)
+            _CACHE.move_to_end(cache_key)
+            if len(_CACHE) > _CACHE_MAX_ENTRIES:
+                _CACHE.popitem(last=False)
+    
+    # Prepare response details
+    response_details = {
+        'status_code': status_code,
+        'headers': response.headers,
+        'url': response.url,
+        'elapsed': response.elapsed,
+        'body': response_body
+    }
+    if revalidated:
+        # Report that the body comes from the cache, and the status actually received
+        response_details['revalidated'] = True
+        response_details['revalidation_status_code'] = response.status_code
+    
+    # The json module for this small per-step payload: its output is pure ASCII
+    # (non-ASCII characters escaped), safe to print on any console encoding, and it
+    # accepts any integer
+    result["stdout"] = json.dumps(response_details, indent=2, default=_json_default)
+    
+    # Check expected status
+    expected_codes = [expected_status] if isinstance(expected_status, int) else expected_status
+    if status_code not in expected_codes:
+        result["stderr"] = f"Expected status {expected_codes}, got {status_code}"
+        result["returncode"] = 1
+    else:
+        result["returncode"] = 0
+    
+    return result
 
 def make_http_request(url, method="GET", auth_type="none", username=None, password=None, 
                      bearer_token=None, custom_auth_header=None, headers=None, body=None,
@@ -66,6 +212,16 @@ def make_http_request(url, method="GET", auth_type="none", username=None, passwo
         # Normalize method to uppercase
         method = method.upper()
         
+        # Fast path for the common plain GET: no auth, headers, proxy or custom TLS
+        if (method == 'GET' and auth_type == "none" and not (auth_username and auth_password)
+                and not auth_token and not headers and not proxy_server
+                and verify_ssl is True and not ca_cert):
+            cache_key = _cache_key(url)
+            cached = _CACHE.get(cache_key)
+            response = _send('GET', url, timeout=timeout,
+                             headers=_conditional_headers(cached) if cached else None)
+            return _format_response(result, response, expected_status, cache_key, cached)
+        
         # Handle standardized authentication parameters (priority over legacy parameters)
         if auth_username and auth_password:
             username = auth_username
@@ -140,32 +296,24 @@ def make_http_request(url, method="GET", auth_type="none", username=None, passwo
             else:
                 request_params['data'] = body
         
-        # Execute the HTTP request
-        response = requests.request(method, url, **request_params)
-        
-        # Prepare response details
-        response_details = {
-            'status_code': response.status_code,
-            'headers': dict(response.headers),
-            'url': response.url,
-            'elapsed': str(response.elapsed)
-        }
+        # Handle conditional GET: revalidate a previously seen response instead of
+        # downloading its body again (only when the caller set no validator itself)
+        cache_key = _cache_key(url, headers) if method == 'GET' and auth_type == "none" else None
+        cached = None
+        if cache_key:
+            user_headers = {key.lower() for key in (headers or {})}
+            if 'if-none-match' not in user_headers and 'if-modified-since' not in user_headers:
+                cached = _CACHE.get(cache_key)
+            if cached:
+                request_params['headers'] = {**(headers or {}), **_conditional_headers(cached)}
+        elif method != 'GET':
+            # Any other method may modify the resource, whatever headers it was read with
+            for key in [key for key in _CACHE if key[0] == url]:
+                del _CACHE[key]
         
-        # Try to parse response content
-        try:
-            response_details['body'] = response.json()
-        except:
-            response_details['body'] = response.text
-        
-        # Check expected status
-        expected_codes = [expected_status] if isinstance(expected_status, int) else expected_status
-        if response.status_code not in expected_codes:
-            result["stderr"] = f"Expected status {expected_codes}, got {response.status_code}"
-            result["returncode"] = 1
-            result["stdout"] = json.dumps(response_details, indent=2)
-        else:
-            result["stdout"] = json.dumps(response_details, indent=2)
-            result["returncode"] = 0
+        # Execute the HTTP request
+        response = _send(method, url, **request_params)
+        _format_response(result, response, expected_status, cache_key, cached)
         
     except requests.exceptions.Timeout:
         result["exception"] = f"Request timed out after {timeout} seconds"
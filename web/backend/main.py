@@ -4,26 +4,59 @@ Test Automation Framework - Web Interface Backend
 FastAPI backend for managing test plans, test catalog, execution logs, and variables.
 """
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, validator
-from typing import List, Optional, Dict, Any
-import json
+from fastapi.responses import FileResponse, JSONResponse
+from pydantic import BaseModel, ValidationError, field_validator
+from typing import List, Optional, Dict, Any, Set, Tuple
+import anyio
+import asyncio
+import contextlib
+import functools
+import hashlib
+import orjson
 import os
+import subprocess
 import sys
 import re
-from datetime import datetime
+import time
+import uuid
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: the backend runs a single worker process there (see __main__)
+    fcntl = None
 
 # Import test execution module
-from test_execution import execution_manager
+from test_execution import OUTPUT_ENCODING, StreamClosed, execution_manager, receive_message, send_message
+
+# Project layout, resolved once at import time
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+TEST_PLANS_DIR = os.path.join(PROJECT_ROOT, 'test_plans')
+SCRIPT_CATALOG_PATH = os.path.join(PROJECT_ROOT, 'scripts', 'script_catalog.json')
+VARIABLES_PATH = os.path.join(PROJECT_ROOT, 'configs', 'variables.json')
+EXECUTION_LOGS_DIR = os.path.join(PROJECT_ROOT, 'test_execution_log')
 
 # Add parent directory to path to import existing framework modules
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(PROJECT_ROOT)
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson (fastapi.responses.ORJSONResponse is deprecated upstream).
+    Read endpoints return it directly: their data comes straight from JSON files, so
+    FastAPI's jsonable_encoder pass over the returned structure is skipped.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 app = FastAPI(
     title="Test Automation Framework API",
     description="Web interface backend for managing test automation framework",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=OrjsonResponse
 )
 
 # CORS middleware to allow frontend communication
@@ -35,6 +68,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Longest run of a test plan executed through the REST endpoint, in seconds: past it the
+# test process is killed and the execution reported as failed
+REST_EXECUTION_TIMEOUT = 3600
+
+# Characters not allowed in generated test plan filenames
+FILENAME_STRIP_RE = re.compile(r'[^a-z0-9_]')
+
+# Execution log filenames: log_<test plan name>_YYYY-MM-DD_HH_MM.json
+LOG_FILENAME_RE = re.compile(
+    r'log_(?P<name>.+)_(?P<date>\d{4}-\d{2}-\d{2})_(?P<hour>\d{2})_(?P<minute>\d{2})\.json\Z'
+)
+
 # Pydantic models
 class TestPlan(BaseModel):
     id: Optional[str] = None
@@ -54,15 +99,18 @@ class Variable(BaseModel):
     value: str
     description: Optional[str] = None
     
-    @validator('name')
-    def validate_name(cls, v):
+    @field_validator('name')
+    @classmethod
+    def validate_name(cls, v: str) -> str:
+        # A letter or underscore followed by alphanumerics and underscores is exactly
+        # an ASCII Python identifier: one C-level check on the valid path
+        if v.isascii() and v.isidentifier():
+            return v
         if not v:
             raise ValueError('Variable name cannot be empty')
         if ' ' in v:
             raise ValueError('Variable name cannot contain spaces')
-        if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', v):
-            raise ValueError('Variable name must start with a letter or underscore and contain only alphanumeric characters and underscores')
-        return v
+        raise ValueError('Variable name must start with a letter or underscore and contain only alphanumeric characters and underscores')
 
 class TestFunction(BaseModel):
     script_path: str
@@ -73,21 +121,285 @@ class TestFunction(BaseModel):
     platform_support: List[str]
     return_structure: Dict[str, str]
 
+# Fields every test case must define
+REQUIRED_TEST_CASE_FIELDS = frozenset(('id', 'name', 'steps'))
+
+# Version of a file content as seen by the caches below: (st_mtime_ns, st_size).
+# The size catches rewrites landing within the filesystem timestamp granularity
+FileVersion = Tuple[int, int]
+
+# Encoded single test plan responses: path -> (version, test_plan_id, body)
+_test_plan_body_cache: Dict[str, Tuple[FileVersion, str, bytes]] = {}
+
+# Execution log listing rows: path -> (version, summary). Only the few summary fields
+# are kept, not the whole log, which can be large
+_log_summary_cache: Dict[str, Tuple[FileVersion, Dict[str, Any]]] = {}
+
+# Formatted local timestamps for the current second: format -> (epoch second, text)
+_timestamp_cache: Dict[str, Tuple[int, str]] = {}
+
+# In-memory mirror of the variables file (see load_variables)
+_variables: Optional[Dict[str, Dict[str, Any]]] = None
+_variables_version: Optional[FileVersion] = None
+
+# In-memory mirror of the script catalog and its (script_path, function_name) keys (see load_catalog)
+_catalog: Optional[Dict[str, Any]] = None
+_catalog_version: Optional[FileVersion] = None
+_catalog_functions: Set[Tuple[str, str]] = set()
+
+# Write handlers await between loading a resource and saving it: each resource has a
+# lock held from the load (or existence check) through the write, so concurrent
+# requests cannot interleave and overwrite each other's changes. The variables and
+# the catalog are also locked across worker processes (see resource_write_lock); new
+# test plan files are created with O_EXCL instead
+_variables_lock = anyio.Lock()
+_catalog_lock = anyio.Lock()
+_test_plans_lock = anyio.Lock()
+
 # Utility functions
 def get_test_plans_directory():
     """Get the path to test plans directory"""
-    return os.path.join(os.path.dirname(__file__), '..', '..', 'test_plans')
+    return TEST_PLANS_DIR
 
 def get_script_catalog_path():
     """Get the path to script catalog"""
-    return os.path.join(os.path.dirname(__file__), '..', '..', 'scripts', 'script_catalog.json')
+    return SCRIPT_CATALOG_PATH
+
+def now_str(fmt: str) -> str:
+    """Format the current local time, formatting again at most once per second per format"""
+    now = int(time.time())
+    cached = _timestamp_cache.get(fmt)
+    if cached and cached[0] == now:
+        return cached[1]
+    text = time.strftime(fmt, time.localtime(now))
+    _timestamp_cache[fmt] = (now, text)
+    return text
+
+def read_file_bytes(path: str) -> bytes:
+    """Read a whole file (blocking, run it in a worker thread)"""
+    # Unbuffered: readall() sizes one read() from fstat, a buffer layer only adds a copy
+    with open(path, 'rb', buffering=0) as f:
+        return f.read()
+
+async def read_json_file(path: str) -> Any:
+    """Read and parse a JSON file without blocking the event loop"""
+    # Open, read and close in a single worker thread hop
+    return orjson.loads(await anyio.to_thread.run_sync(read_file_bytes, path))
+
+def file_version(stat_result: os.stat_result) -> FileVersion:
+    """Cache key of a file content, from its stat info"""
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+def forget_cached(path: str):
+    """Drop every cached view of a file that is about to change"""
+    _test_plan_body_cache.pop(path, None)
+    _log_summary_cache.pop(path, None)
+
+def write_file_atomic(path: str, content: bytes) -> FileVersion:
+    """
+    Replace a file with new content (blocking, run it in a worker thread).
+    The content goes to a temporary file first, is flushed to disk, then renamed over
+    the target: readers see either the old or the new file, never a torn one.
+    Returns the version (see file_version) of the written file.
+    """
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return file_version(os.stat(path))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def create_file_exclusive(path: str, content: bytes) -> FileVersion:
+    """
+    Create a new file with content (blocking, run it in a worker thread).
+    The file is opened with O_EXCL: if it already exists, FileExistsError is raised,
+    so two creations of the same file cannot both succeed, even across worker processes.
+    Returns the version (see file_version) of the written file.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0))
+    try:
+        with open(fd, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        return file_version(os.stat(path))
+    except BaseException:
+        os.remove(path)
+        raise
+
+async def create_json_file(path: str, data: Any) -> FileVersion:
+    """Serialize data to a new JSON file without blocking the event loop (FileExistsError if it exists)"""
+    forget_cached(path)
+    content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return await anyio.to_thread.run_sync(create_file_exclusive, path, content)
+
+def lock_file(path: str) -> Optional[int]:
+    """
+    Take an exclusive OS lock on a lock file, waiting for it (blocking, run it in a worker
+    thread). Returns the descriptor to pass to unlock_file, None where there is no flock.
+    """
+    if fcntl is None:
+        return None
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+def unlock_file(fd: Optional[int]):
+    """Release a lock taken with lock_file"""
+    if fd is not None:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+@contextlib.asynccontextmanager
+async def resource_write_lock(lock: anyio.Lock, path: str):
+    """
+    Serialize the load -> save of a JSON resource file: the in-process lock orders the
+    handlers of this worker, an OS lock on <path>.lock those of all worker processes,
+    so each one loads the version written by the previous one
+    """
+    async with lock:
+        fd = await anyio.to_thread.run_sync(lock_file, f"{path}.lock")
+        try:
+            yield
+        finally:
+            unlock_file(fd)
+
+async def write_json_file(path: str, data: Any) -> FileVersion:
+    """Serialize data to a JSON file without blocking the event loop, returning its new version"""
+    forget_cached(path)
+    content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return await anyio.to_thread.run_sync(write_file_atomic, path, content)
+
+async def remove_file(path: str):
+    """Remove a file without blocking the event loop"""
+    forget_cached(path)
+    await anyio.to_thread.run_sync(os.remove, path)
+
+def list_json_files(directory: str) -> List[os.DirEntry]:
+    """
+    List the JSON files of a directory (blocking, run it in a worker thread).
+    The stat info of each entry is fetched here and cached on the DirEntry.
+    """
+    json_files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False):
+                entry.stat(follow_symlinks=False)
+                json_files.append(entry)
+    return json_files
+
+def file_etag(stat_result: os.stat_result) -> str:
+    """ETag of a response derived from one file, changing whenever the file is rewritten"""
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+def directory_etag(entries: List[os.DirEntry]) -> str:
+    """ETag of a response derived from several files, also changing when one is added, renamed or removed"""
+    digest = hashlib.blake2b(digest_size=16)
+    for entry in entries:
+        digest.update(f"{entry.name}:{file_etag(entry.stat(follow_symlinks=False))};".encode())
+    return f'"{digest.hexdigest()}"'
+
+def cache_headers(etag: str) -> Dict[str, str]:
+    """Validator headers of a read response: clients keep the body but revalidate it on every use"""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return an empty 304 response if the client already holds the current version"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    if '*' in tags or etag in tags or f"W/{etag}" in tags:
+        return Response(status_code=304, headers=cache_headers(etag))
+    return None
+
+async def encode_test_plan(path: str, test_plan_id: str, version: FileVersion) -> bytes:
+    """
+    Encoded JSON of a test plan as served by the API (file content plus its id).
+    The body is kept while the file is unchanged: no parse, no encode.
+    """
+    cached = _test_plan_body_cache.get(path)
+    if cached and cached[0] == version and cached[1] == test_plan_id:
+        return cached[2]
+    test_plan_data = await read_json_file(path)
+    body = orjson.dumps({**test_plan_data, 'id': test_plan_id})
+    _test_plan_body_cache[path] = (version, test_plan_id, body)
+    return body
+
+async def summarize_execution_log(entry: os.DirEntry, log_name: re.Match) -> Dict[str, Any]:
+    """
+    Listing row of an execution log, from its filename metadata and content.
+    The log is read and parsed again only when its version changes.
+    """
+    version = file_version(entry.stat(follow_symlinks=False))
+    cached = _log_summary_cache.get(entry.path)
+    if cached and cached[0] == version:
+        return cached[1]
+    
+    log_data = await read_json_file(entry.path)
+    summary = {
+        "filename": entry.name,
+        "test_plan_name": log_name['name'].replace('_', ' '),
+        "execution_date": log_name['date'],
+        "execution_time": f"{log_name['hour']}:{log_name['minute']}",
+        "timestamp": log_data.get("timestamp", ""),
+        "execution_time_seconds": log_data.get("execution_time_seconds", 0),
+        "results": log_data.get("results", {}),
+        "current_user": log_data.get("current_user", ""),
+        "execution_id": log_data.get("execution_id", "")
+    }
+    _log_summary_cache[entry.path] = (version, summary)
+    return summary
+
+def json_body(model: type):
+    """
+    Dependency parsing a request body straight into a model with Pydantic's JSON parser.
+    A plain model parameter is decoded by the json module and then validated as a second
+    pass over the resulting objects; large test plans are better parsed only once.
+    Errors are reported like FastAPI's own body validation errors (422).
+    """
+    async def parse_body(request: Request):
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError([
+                {**error, 'loc': ('body', *error['loc'])} for error in e.errors(include_url=False)
+            ])
+    return parse_body
+
+def json_body_openapi(model: type) -> Dict[str, Any]:
+    """
+    openapi_extra of a route reading its body with json_body: the body is not a declared
+    parameter, so its schema is added to the route's OpenAPI operation explicitly.
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}}
+        }
+    }
 
 def generate_filename(name: str) -> str:
     """Generate filename from test plan name (convert spaces to underscores)"""
+    # Fast path for names that are already clean: lowercase ASCII alphanumerics and
+    # inner underscores come out unchanged, no need for the regex
+    if (name.isascii() and name.islower() and name.replace('_', '').isalnum()
+            and name[0] != '_' and name[-1] != '_'):
+        return f"{name}.json"
     # Convert to lowercase and replace spaces with underscores
     filename = name.lower().replace(' ', '_')
     # Remove any non-alphanumeric characters except underscores
-    filename = re.sub(r'[^a-z0-9_]', '', filename)
+    filename = FILENAME_STRIP_RE.sub('', filename)
     # Ensure it doesn't start or end with underscore
     filename = filename.strip('_')
     # Add .json extension
@@ -95,19 +407,13 @@ def generate_filename(name: str) -> str:
 
 def validate_test_cases(test_cases: List[Dict[str, Any]]) -> bool:
     """Validate test cases structure"""
-    if not isinstance(test_cases, list):
-        return False
-    
-    for test_case in test_cases:
-        if not isinstance(test_case, dict):
-            return False
-        # Basic validation for required fields in test cases
-        if 'id' not in test_case or 'name' not in test_case or 'steps' not in test_case:
-            return False
-        if not isinstance(test_case['steps'], list):
-            return False
-    
-    return True
+    # Each test case must be a dict holding the required fields, with a list of steps
+    return isinstance(test_cases, list) and all(
+        isinstance(test_case, dict)
+        and not (REQUIRED_TEST_CASE_FIELDS - test_case.keys())
+        and isinstance(test_case['steps'], list)
+        for test_case in test_cases
+    )
 
 # API Routes
 @app.get("/")
@@ -120,125 +426,169 @@ async def root():
     }
 
 @app.get("/api/test-plans")
-async def get_test_plans():
+async def get_test_plans(request: Request):
     """Get all test plans"""
     test_plans_dir = get_test_plans_directory()
-    test_plans = []
     
     try:
-        for filename in os.listdir(test_plans_dir):
-            if filename.endswith('.json'):
-                file_path = os.path.join(test_plans_dir, filename)
-                with open(file_path, 'r') as f:
-                    test_plan_data = json.load(f)
-                    test_plan_data['id'] = filename.replace('.json', '')
-                    test_plans.append(test_plan_data)
+        entries = await anyio.to_thread.run_sync(list_json_files, test_plans_dir)
+        
+        # Forget the bodies of plans deleted or renamed outside of the API
+        for path in _test_plan_body_cache.keys() - {entry.path for entry in entries}:
+            del _test_plan_body_cache[path]
+        
+        # The listing only changes with the directory entries: answer 304 without reading any plan
+        etag = directory_etag(entries)
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
+        # Each element of the list is the body served for that plan alone: splice the
+        # cached bodies together instead of building and encoding the whole list.
+        # The plans are read concurrently so their disk reads overlap
+        test_plan_bodies = await asyncio.gather(*(
+            encode_test_plan(entry.path, entry.name[:-len('.json')], file_version(entry.stat(follow_symlinks=False)))
+            for entry in entries
+        ))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading test plans: {str(e)}")
     
-    return test_plans
+    return Response(
+        content=b'[' + b','.join(test_plan_bodies) + b']',
+        media_type="application/json",
+        headers=cache_headers(etag)
+    )
 
 @app.get("/api/test-plans/{test_plan_id}")
-async def get_test_plan(test_plan_id: str):
+async def get_test_plan(test_plan_id: str, request: Request):
     """Get specific test plan by ID"""
     test_plan_path = os.path.join(get_test_plans_directory(), f"{test_plan_id}.json")
     
     try:
-        with open(test_plan_path, 'r') as f:
-            test_plan_data = json.load(f)
-            test_plan_data['id'] = test_plan_id
-            return test_plan_data
+        test_plan_stat = await anyio.to_thread.run_sync(os.stat, test_plan_path)
+        etag = file_etag(test_plan_stat)
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
+        
+        body = await encode_test_plan(test_plan_path, test_plan_id, file_version(test_plan_stat))
+        return Response(content=body, media_type="application/json", headers=cache_headers(etag))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Test plan not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading test plan: {str(e)}")
 
 @app.get("/api/test-catalog")
-async def get_test_catalog():
+async def get_test_catalog(request: Request):
     """Get all available test functions from catalog"""
     catalog_path = get_script_catalog_path()
     
     try:
-        with open(catalog_path, 'r') as f:
-            catalog_data = json.load(f)
-            return catalog_data
+        catalog_stat = await anyio.to_thread.run_sync(os.stat, catalog_path)
+        etag = file_etag(catalog_stat)
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
+        
+        # The catalog is stored as JSON already: send the file as is (sendfile where
+        # available) instead of parsing it only to serialize it again
+        return FileResponse(catalog_path, media_type="application/json", stat_result=catalog_stat,
+                            headers=cache_headers(etag))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading test catalog: {str(e)}")
 
 def get_variables_path():
     """Get the path to variables configuration"""
-    return os.path.join(os.path.dirname(__file__), '..', '..', 'configs', 'variables.json')
+    return VARIABLES_PATH
 
 def get_execution_logs_directory():
     """Get the path to execution logs directory"""
-    return os.path.join(os.path.dirname(__file__), '..', '..', 'test_execution_log')
+    return EXECUTION_LOGS_DIR
 
-def load_variables():
-    """Load variables from file and handle both old and new formats"""
+async def load_variables() -> Dict[str, Dict[str, Any]]:
+    """
+    Load variables (name -> variable, in file order) and handle both old and new formats.
+    The result is an in-memory mirror of the file, parsed again only when the file
+    modification time or size changes; changes must be persisted with save_variables.
+    """
+    global _variables, _variables_version
     variables_path = get_variables_path()
     try:
-        with open(variables_path, 'r') as f:
-            variables_data = json.load(f)
+        version = file_version(await anyio.to_thread.run_sync(os.stat, variables_path))
+        if _variables is not None and _variables_version == version:
+            return _variables
+        
+        variables_data = await read_json_file(variables_path)
         
         # Handle new enhanced format
         if isinstance(variables_data, dict) and "variables" in variables_data:
-            return variables_data["variables"]
-        
-        # Handle old key-value format (backward compatibility)
-        variables_list = []
-        for name, value in variables_data.items():
-            variables_list.append({
-                "name": name,
-                "value": value,
-                "description": ""
-            })
-        return variables_list
+            variables_list = variables_data["variables"]
+        else:
+            # Handle old key-value format (backward compatibility)
+            variables_list = [
+                {"name": name, "value": value, "description": ""}
+                for name, value in variables_data.items()
+            ]
+        
+        _variables = {variable["name"]: variable for variable in variables_list}
+        _variables_version = version
+        return _variables
     except FileNotFoundError:
-        return []
+        return {}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading variables: {str(e)}")
 
-def save_variables(variables_list):
+async def save_variables(variables: Dict[str, Dict[str, Any]]):
     """Save variables to file in enhanced format with descriptions"""
+    global _variables, _variables_version
     variables_path = get_variables_path()
     try:
         # Save in enhanced format that includes descriptions
         enhanced_variables = {
-            "variables": variables_list,
-            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "variables": list(variables.values()),
+            "last_updated": now_str("%Y-%m-%d %H:%M:%S")
         }
         
-        with open(variables_path, 'w') as f:
-            json.dump(enhanced_variables, f, indent=2)
+        _variables_version = await write_json_file(variables_path, enhanced_variables)
+        _variables = variables
     except Exception as e:
+        # The mirror may hold unsaved changes: reload it from file next time
+        _variables = None
         raise HTTPException(status_code=500, detail=f"Error saving variables: {str(e)}")
 
 @app.get("/api/variables")
-async def get_variables():
+async def get_variables(request: Request):
     """Get all variables from configuration"""
-    return load_variables()
+    try:
+        etag = file_etag(await anyio.to_thread.run_sync(os.stat, get_variables_path()))
+    except FileNotFoundError:
+        return OrjsonResponse([])
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+    return OrjsonResponse(list((await load_variables()).values()), headers=cache_headers(etag))
 
 @app.post("/api/variables")
 async def create_variable(variable: Variable):
     """Create a new variable"""
     try:
-        variables = load_variables()
-        
-        # Check if variable already exists
-        for existing_var in variables:
-            if existing_var["name"] == variable.name:
+        async with resource_write_lock(_variables_lock, get_variables_path()):
+            # Changes go to a copy: the mirror is only replaced once they are saved
+            variables = dict(await load_variables())
+            
+            # Check if variable already exists
+            if variable.name in variables:
                 raise HTTPException(status_code=400, detail="Variable with this name already exists")
-        
-        # Add new variable
-        new_variable = {
-            "name": variable.name,
-            "value": variable.value,
-            "description": variable.description or ""
-        }
-        variables.append(new_variable)
-        
-        # Save updated variables
-        save_variables(variables)
+            
+            # Add new variable
+            new_variable = {
+                "name": variable.name,
+                "value": variable.value,
+                "description": variable.description or ""
+            }
+            variables[variable.name] = new_variable
+            
+            # Save updated variables
+            await save_variables(variables)
         
         return {
             "message": "Variable created successfully",
@@ -254,37 +604,39 @@ async def create_variable(variable: Variable):
 async def update_variable(variable_name: str, variable: Variable):
     """Update an existing variable"""
     try:
-        variables = load_variables()
-        
-        # Find the variable to update
-        variable_index = -1
-        for i, existing_var in enumerate(variables):
-            if existing_var["name"] == variable_name:
-                variable_index = i
-                break
-        
-        if variable_index == -1:
-            raise HTTPException(status_code=404, detail="Variable not found")
-        
-        # If name is being changed, check for conflicts
-        if variable.name != variable_name:
-            for existing_var in variables:
-                if existing_var["name"] == variable.name and existing_var["name"] != variable_name:
-                    raise HTTPException(status_code=400, detail="Variable with this name already exists")
-        
-        # Update variable
-        variables[variable_index] = {
-            "name": variable.name,
-            "value": variable.value,
-            "description": variable.description or ""
-        }
-        
-        # Save updated variables
-        save_variables(variables)
+        async with resource_write_lock(_variables_lock, get_variables_path()):
+            # Changes go to a copy: the mirror is only replaced once they are saved
+            variables = dict(await load_variables())
+            
+            if variable_name not in variables:
+                raise HTTPException(status_code=404, detail="Variable not found")
+            
+            # If name is being changed, check for conflicts
+            if variable.name != variable_name and variable.name in variables:
+                raise HTTPException(status_code=400, detail="Variable with this name already exists")
+            
+            updated_variable = {
+                "name": variable.name,
+                "value": variable.value,
+                "description": variable.description or ""
+            }
+            
+            # Update variable, keeping its position when it is renamed
+            if variable.name == variable_name:
+                variables[variable_name] = updated_variable
+            else:
+                variables = {
+                    (variable.name if name == variable_name else name):
+                        (updated_variable if name == variable_name else existing_var)
+                    for name, existing_var in variables.items()
+                }
+            
+            # Save updated variables
+            await save_variables(variables)
         
         return {
             "message": "Variable updated successfully",
-            "variable": variables[variable_index]
+            "variable": updated_variable
         }
         
     except HTTPException:
@@ -296,23 +648,17 @@ async def update_variable(variable_name: str, variable: Variable):
 async def delete_variable(variable_name: str):
     """Delete a variable"""
     try:
-        variables = load_variables()
-        
-        # Find the variable to delete
-        variable_index = -1
-        for i, existing_var in enumerate(variables):
-            if existing_var["name"] == variable_name:
-                variable_index = i
-                break
-        
-        if variable_index == -1:
-            raise HTTPException(status_code=404, detail="Variable not found")
-        
-        # Remove variable
-        deleted_variable = variables.pop(variable_index)
-        
-        # Save updated variables
-        save_variables(variables)
+        async with resource_write_lock(_variables_lock, get_variables_path()):
+            # Changes go to a copy: the mirror is only replaced once they are saved
+            variables = dict(await load_variables())
+            
+            # Remove variable
+            deleted_variable = variables.pop(variable_name, None)
+            if deleted_variable is None:
+                raise HTTPException(status_code=404, detail="Variable not found")
+            
+            # Save updated variables
+            await save_variables(variables)
         
         return {
             "message": "Variable deleted successfully",
@@ -324,35 +670,38 @@ async def delete_variable(variable_name: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting variable: {str(e)}")
 
-@app.post("/api/test-plans")
-async def create_test_plan(test_plan: TestPlan):
+@app.post("/api/test-plans", openapi_extra=json_body_openapi(TestPlan))
+async def create_test_plan(test_plan: TestPlan = Depends(json_body(TestPlan))):
     """Create a new test plan"""
     try:
-        # Generate filename from name
-        filename = generate_filename(test_plan.name)
-        file_path = os.path.join(get_test_plans_directory(), filename)
-        
-        # Check if file already exists
-        if os.path.exists(file_path):
-            raise HTTPException(status_code=400, detail="Test plan with this name already exists")
-        
-        # Validate test cases structure
-        if not validate_test_cases(test_plan.test_cases):
-            raise HTTPException(status_code=400, detail="Invalid test cases structure")
-        
-        # Prepare test plan data
-        test_plan_data = {
-            "name": test_plan.name,
-            "description": test_plan.description,
-            "version": test_plan.version,
-            "author": test_plan.author,
-            "created_date": datetime.now().strftime("%Y-%m-%d"),
-            "test_cases": test_plan.test_cases
-        }
-        
-        # Write to file
-        with open(file_path, 'w') as f:
-            json.dump(test_plan_data, f, indent=4)
+        async with _test_plans_lock:
+            # Generate filename from name
+            filename = generate_filename(test_plan.name)
+            file_path = os.path.join(get_test_plans_directory(), filename)
+            
+            # Check if file already exists
+            if await anyio.to_thread.run_sync(os.path.exists, file_path):
+                raise HTTPException(status_code=400, detail="Test plan with this name already exists")
+            
+            # Validate test cases structure
+            if not validate_test_cases(test_plan.test_cases):
+                raise HTTPException(status_code=400, detail="Invalid test cases structure")
+            
+            # Prepare test plan data
+            test_plan_data = {
+                "name": test_plan.name,
+                "description": test_plan.description,
+                "version": test_plan.version,
+                "author": test_plan.author,
+                "created_date": now_str("%Y-%m-%d"),
+                "test_cases": test_plan.test_cases
+            }
+            
+            # Write to a new file, unless another worker process created it meanwhile
+            try:
+                await create_json_file(file_path, test_plan_data)
+            except FileExistsError:
+                raise HTTPException(status_code=400, detail="Test plan with this name already exists")
         
         return {
             "message": "Test plan created successfully",
@@ -365,51 +714,52 @@ async def create_test_plan(test_plan: TestPlan):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating test plan: {str(e)}")
 
-@app.put("/api/test-plans/{test_plan_id}")
-async def update_test_plan(test_plan_id: str, test_plan: TestPlan):
+@app.put("/api/test-plans/{test_plan_id}", openapi_extra=json_body_openapi(TestPlan))
+async def update_test_plan(test_plan_id: str, test_plan: TestPlan = Depends(json_body(TestPlan))):
     """Update an existing test plan"""
     try:
-        # Check if test plan exists
-        existing_path = os.path.join(get_test_plans_directory(), f"{test_plan_id}.json")
-        if not os.path.exists(existing_path):
-            raise HTTPException(status_code=404, detail="Test plan not found")
-        
-        # Validate test cases structure
-        if not validate_test_cases(test_plan.test_cases):
-            raise HTTPException(status_code=400, detail="Invalid test cases structure")
-        
-        # Generate new filename if name changed
-        new_filename = generate_filename(test_plan.name)
-        new_file_path = os.path.join(get_test_plans_directory(), new_filename)
-        
-        # If name changed and new filename conflicts with existing file
-        if new_filename != f"{test_plan_id}.json" and os.path.exists(new_file_path):
-            raise HTTPException(status_code=400, detail="Test plan with this name already exists")
-        
-        # Read existing test plan to preserve created_date
-        with open(existing_path, 'r') as f:
-            existing_data = json.load(f)
-        
-        # Prepare updated test plan data
-        test_plan_data = {
-            "name": test_plan.name,
-            "description": test_plan.description,
-            "version": test_plan.version,
-            "author": test_plan.author,
-            "created_date": existing_data.get("created_date", datetime.now().strftime("%Y-%m-%d")),
-            "test_cases": test_plan.test_cases
-        }
-        
-        # If filename changed, delete old file and create new one
-        if new_filename != f"{test_plan_id}.json":
-            os.remove(existing_path)
-            file_path = new_file_path
-        else:
-            file_path = existing_path
-        
-        # Write updated data
-        with open(file_path, 'w') as f:
-            json.dump(test_plan_data, f, indent=4)
+        async with _test_plans_lock:
+            # Read existing test plan to preserve created_date; a missing file
+            # means the test plan does not exist (saves a separate exists() hop)
+            existing_path = os.path.join(get_test_plans_directory(), f"{test_plan_id}.json")
+            try:
+                existing_data = await read_json_file(existing_path)
+            except FileNotFoundError:
+                raise HTTPException(status_code=404, detail="Test plan not found")
+            
+            # Validate test cases structure
+            if not validate_test_cases(test_plan.test_cases):
+                raise HTTPException(status_code=400, detail="Invalid test cases structure")
+            
+            # Generate new filename if name changed
+            new_filename = generate_filename(test_plan.name)
+            new_file_path = os.path.join(get_test_plans_directory(), new_filename)
+            
+            # If name changed and new filename conflicts with existing file
+            if new_filename != f"{test_plan_id}.json" and await anyio.to_thread.run_sync(os.path.exists, new_file_path):
+                raise HTTPException(status_code=400, detail="Test plan with this name already exists")
+            
+            # Prepare updated test plan data
+            test_plan_data = {
+                "name": test_plan.name,
+                "description": test_plan.description,
+                "version": test_plan.version,
+                "author": test_plan.author,
+                "created_date": existing_data.get("created_date", now_str("%Y-%m-%d")),
+                "test_cases": test_plan.test_cases
+            }
+            
+            # If filename changed, create the new file (unless another worker process
+            # created it meanwhile) and then delete the old one
+            if new_filename != f"{test_plan_id}.json":
+                try:
+                    await create_json_file(new_file_path, test_plan_data)
+                except FileExistsError:
+                    raise HTTPException(status_code=400, detail="Test plan with this name already exists")
+                await remove_file(existing_path)
+            else:
+                # Write updated data
+                await write_json_file(existing_path, test_plan_data)
         
         return {
             "message": "Test plan updated successfully",
@@ -428,11 +778,12 @@ async def delete_test_plan(test_plan_id: str):
     try:
         file_path = os.path.join(get_test_plans_directory(), f"{test_plan_id}.json")
         
-        if not os.path.exists(file_path):
+        try:
+            async with _test_plans_lock:
+                await remove_file(file_path)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Test plan not found")
         
-        os.remove(file_path)
-        
         return {
             "message": "Test plan deleted successfully",
             "id": test_plan_id
@@ -443,41 +794,66 @@ async def delete_test_plan(test_plan_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting test plan: {str(e)}")
 
-@app.post("/api/test-catalog")
-async def create_test_function(test_function: TestFunction):
+async def load_catalog() -> Dict[str, Any]:
+    """
+    Load the script catalog for modification.
+    The result is an in-memory mirror of the file, parsed again only when the file
+    modification time or size changes; changes must be persisted with save_catalog.
+    """
+    global _catalog, _catalog_version, _catalog_functions
+    catalog_path = get_script_catalog_path()
+    version = file_version(await anyio.to_thread.run_sync(os.stat, catalog_path))
+    if _catalog is not None and _catalog_version == version:
+        return _catalog
+    
+    catalog_data = await read_json_file(catalog_path)
+    _catalog_functions = {
+        (script["script_path"], script["function_name"]) for script in catalog_data.get("scripts", [])
+    }
+    _catalog = catalog_data
+    _catalog_version = version
+    return _catalog
+
+async def save_catalog(catalog_data: Dict[str, Any]):
+    """Stamp and save the script catalog, keeping the in-memory mirror in sync"""
+    global _catalog, _catalog_version, _catalog_functions
+    catalog_data["last_updated"] = now_str("%Y-%m-%d")
+    try:
+        _catalog_version = await write_json_file(get_script_catalog_path(), catalog_data)
+    except Exception:
+        # The mirror holds unsaved changes: reload it from file next time
+        _catalog = None
+        raise
+    _catalog_functions = {
+        (script["script_path"], script["function_name"]) for script in catalog_data.get("scripts", [])
+    }
+
+@app.post("/api/test-catalog", openapi_extra=json_body_openapi(TestFunction))
+async def create_test_function(test_function: TestFunction = Depends(json_body(TestFunction))):
     """Create a new test function in catalog"""
     try:
-        catalog_path = get_script_catalog_path()
-        
-        # Read existing catalog
-        with open(catalog_path, 'r') as f:
-            catalog_data = json.load(f)
-        
-        # Check if function already exists
-        for script in catalog_data.get("scripts", []):
-            if (script["script_path"] == test_function.script_path and 
-                script["function_name"] == test_function.function_name):
+        async with resource_write_lock(_catalog_lock, get_script_catalog_path()):
+            catalog_data = await load_catalog()
+            
+            # Check if function already exists
+            if (test_function.script_path, test_function.function_name) in _catalog_functions:
                 raise HTTPException(status_code=400, detail="Test function already exists")
-        
-        # Add new function
-        new_function = {
-            "script_path": test_function.script_path,
-            "function_name": test_function.function_name,
-            "function_args": test_function.function_args,
-            "description": test_function.description,
-            "category": test_function.category,
-            "platform_support": test_function.platform_support,
-            "return_structure": test_function.return_structure
-        }
-        
-        catalog_data["scripts"].append(new_function)
-        
-        # Update last_updated
-        catalog_data["last_updated"] = datetime.now().strftime("%Y-%m-%d")
-        
-        # Write back to file
-        with open(catalog_path, 'w') as f:
-            json.dump(catalog_data, f, indent=2)
+            
+            # Add new function
+            new_function = {
+                "script_path": test_function.script_path,
+                "function_name": test_function.function_name,
+                "function_args": test_function.function_args,
+                "description": test_function.description,
+                "category": test_function.category,
+                "platform_support": test_function.platform_support,
+                "return_structure": test_function.return_structure
+            }
+            
+            catalog_data["scripts"].append(new_function)
+            
+            # Write back to file
+            await save_catalog(catalog_data)
         
         return {
             "message": "Test function created successfully",
@@ -489,37 +865,30 @@ async def create_test_function(test_function: TestFunction):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating test function: {str(e)}")
 
-@app.put("/api/test-catalog/{function_index}")
-async def update_test_function(function_index: int, test_function: TestFunction):
+@app.put("/api/test-catalog/{function_index}", openapi_extra=json_body_openapi(TestFunction))
+async def update_test_function(function_index: int, test_function: TestFunction = Depends(json_body(TestFunction))):
     """Update an existing test function in catalog"""
     try:
-        catalog_path = get_script_catalog_path()
-        
-        # Read existing catalog
-        with open(catalog_path, 'r') as f:
-            catalog_data = json.load(f)
-        
-        # Check if function index is valid
-        if function_index < 0 or function_index >= len(catalog_data.get("scripts", [])):
-            raise HTTPException(status_code=404, detail="Test function not found")
-        
-        # Update function
-        catalog_data["scripts"][function_index] = {
-            "script_path": test_function.script_path,
-            "function_name": test_function.function_name,
-            "function_args": test_function.function_args,
-            "description": test_function.description,
-            "category": test_function.category,
-            "platform_support": test_function.platform_support,
-            "return_structure": test_function.return_structure
-        }
-        
-        # Update last_updated
-        catalog_data["last_updated"] = datetime.now().strftime("%Y-%m-%d")
-        
-        # Write back to file
-        with open(catalog_path, 'w') as f:
-            json.dump(catalog_data, f, indent=2)
+        async with resource_write_lock(_catalog_lock, get_script_catalog_path()):
+            catalog_data = await load_catalog()
+            
+            # Check if function index is valid
+            if function_index < 0 or function_index >= len(catalog_data.get("scripts", [])):
+                raise HTTPException(status_code=404, detail="Test function not found")
+            
+            # Update function
+            catalog_data["scripts"][function_index] = {
+                "script_path": test_function.script_path,
+                "function_name": test_function.function_name,
+                "function_args": test_function.function_args,
+                "description": test_function.description,
+                "category": test_function.category,
+                "platform_support": test_function.platform_support,
+                "return_structure": test_function.return_structure
+            }
+            
+            # Write back to file
+            await save_catalog(catalog_data)
         
         return {
             "message": "Test function updated successfully",
@@ -535,28 +904,21 @@ async def update_test_function(function_index: int, test_function: TestFunction)
 async def delete_test_function(function_index: int):
     """Delete a test function from catalog"""
     try:
-        catalog_path = get_script_catalog_path()
-        
-        # Read existing catalog
-        with open(catalog_path, 'r') as f:
-            catalog_data = json.load(f)
-        
-        # Check if function index is valid
-        if function_index < 0 or function_index >= len(catalog_data.get("scripts", [])):
-            raise HTTPException(status_code=404, detail="Test function not found")
-        
-        # Get function name for response
-        function_name = catalog_data["scripts"][function_index]["function_name"]
-        
-        # Remove function
-        catalog_data["scripts"].pop(function_index)
-        
-        # Update last_updated
-        catalog_data["last_updated"] = datetime.now().strftime("%Y-%m-%d")
-        
-        # Write back to file
-        with open(catalog_path, 'w') as f:
-            json.dump(catalog_data, f, indent=2)
+        async with resource_write_lock(_catalog_lock, get_script_catalog_path()):
+            catalog_data = await load_catalog()
+            
+            # Check if function index is valid
+            if function_index < 0 or function_index >= len(catalog_data.get("scripts", [])):
+                raise HTTPException(status_code=404, detail="Test function not found")
+            
+            # Get function name for response
+            function_name = catalog_data["scripts"][function_index]["function_name"]
+            
+            # Remove function
+            catalog_data["scripts"].pop(function_index)
+            
+            # Write back to file
+            await save_catalog(catalog_data)
         
         return {
             "message": "Test function deleted successfully",
@@ -575,42 +937,37 @@ async def get_execution_logs():
     execution_logs = []
     
     try:
-        for filename in os.listdir(execution_logs_dir):
-            if filename.endswith('.json'):
-                file_path = os.path.join(execution_logs_dir, filename)
-                try:
-                    with open(file_path, 'r') as f:
-                        log_data = json.load(f)
-                    
-                    # Parse filename to extract metadata
-                    # Format: log_Test Plan Name_YYYY-MM-DD_HH_MM.json
-                    filename_parts = filename.replace('log_', '').replace('.json', '').split('_')
-                    test_plan_name = ' '.join(filename_parts[:-3])  # Everything except date/time parts
-                    date_part = filename_parts[-3]
-                    time_part = f"{filename_parts[-2]}:{filename_parts[-1]}"
-                    
-                    execution_logs.append({
-                        "filename": filename,
-                        "test_plan_name": test_plan_name,
-                        "execution_date": date_part,
-                        "execution_time": time_part,
-                        "timestamp": log_data.get("timestamp", ""),
-                        "execution_time_seconds": log_data.get("execution_time_seconds", 0),
-                        "results": log_data.get("results", {}),
-                        "current_user": log_data.get("current_user", ""),
-                        "execution_id": log_data.get("execution_id", "")
-                    })
-                except Exception as e:
-                    print(f"Error reading log file {filename}: {str(e)}")
-                    continue
-                    
+        # Parse the metadata out of the filenames, skipping files that are not execution logs
+        # Format: log_Test_Plan_Name_YYYY-MM-DD_HH_MM.json
+        log_entries = []
+        for entry in await anyio.to_thread.run_sync(list_json_files, execution_logs_dir):
+            log_name = LOG_FILENAME_RE.match(entry.name)
+            if log_name:
+                log_entries.append((entry, log_name))
+        
+        # Forget the summaries of logs deleted outside of the API
+        for path in _log_summary_cache.keys() - {entry.path for entry, _ in log_entries}:
+            del _log_summary_cache[path]
+        
+        # Only new or changed logs are read, concurrently so their disk reads overlap.
+        # A log that cannot be read comes back as its exception and is skipped below
+        summaries = await asyncio.gather(
+            *(summarize_execution_log(entry, log_name) for entry, log_name in log_entries),
+            return_exceptions=True
+        )
+        for (entry, _), summary in zip(log_entries, summaries):
+            if isinstance(summary, BaseException):
+                print(f"Error reading log file {entry.name}: {str(summary)}")
+                continue
+            execution_logs.append(summary)
+                
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading execution logs: {str(e)}")
     
     # Sort by timestamp descending (most recent first)
     execution_logs.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
     
-    return execution_logs
+    return OrjsonResponse(execution_logs)
 
 @app.get("/api/execution-log/{filename}")
 async def get_execution_log(filename: str):
@@ -618,9 +975,9 @@ async def get_execution_log(filename: str):
     execution_log_path = os.path.join(get_execution_logs_directory(), filename)
     
     try:
-        with open(execution_log_path, 'r') as f:
-            log_data = json.load(f)
-            return log_data
+        # Not cached: a full log is opened once in a while and can be large, the
+        # listing only keeps the summaries
+        return OrjsonResponse(await read_json_file(execution_log_path))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Execution log not found")
     except Exception as e:
@@ -632,11 +989,11 @@ async def delete_execution_log(filename: str):
     execution_log_path = os.path.join(get_execution_logs_directory(), filename)
     
     try:
-        if not os.path.exists(execution_log_path):
+        try:
+            await remove_file(execution_log_path)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Execution log not found")
         
-        os.remove(execution_log_path)
-        
         return {
             "message": "Execution log deleted successfully",
             "filename": filename
@@ -655,16 +1012,19 @@ async def bulk_delete_execution_logs(filenames: List[str]):
     errors = []
     
     try:
-        for filename in filenames:
-            execution_log_path = os.path.join(execution_logs_dir, filename)
-            if os.path.exists(execution_log_path):
-                try:
-                    os.remove(execution_log_path)
-                    deleted_files.append(filename)
-                except Exception as e:
-                    errors.append(f"Error deleting {filename}: {str(e)}")
-            else:
+        # Remove the files concurrently on worker threads; each failure comes back as
+        # its exception, in the order of the request
+        results = await asyncio.gather(
+            *(remove_file(os.path.join(execution_logs_dir, filename)) for filename in filenames),
+            return_exceptions=True
+        )
+        for filename, result in zip(filenames, results):
+            if isinstance(result, FileNotFoundError):
                 errors.append(f"File not found: {filename}")
+            elif isinstance(result, BaseException):
+                errors.append(f"Error deleting {filename}: {str(result)}")
+            else:
+                deleted_files.append(filename)
         
         return {
             "message": f"Deleted {len(deleted_files)} execution logs",
@@ -675,15 +1035,53 @@ async def bulk_delete_execution_logs(filenames: List[str]):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error during bulk deletion: {str(e)}")
 
+def timeout_output_text(output: Any) -> str:
+    """
+    Output captured before a subprocess.run timeout, as text: it is bytes on POSIX even
+    with text=True, but already text on Windows, where run() collects it with communicate()
+    """
+    if not output:
+        return ""
+    return output if isinstance(output, str) else output.decode(OUTPUT_ENCODING, errors='replace')
+
 @app.post("/api/test-execution")
 async def execute_test_plan(request: TestExecutionRequest):
-    """Execute a test plan"""
-    # This will be integrated with the existing test execution framework
+    """Execute a test plan and return its output once finished"""
+    test_plan_path = os.path.join(get_test_plans_directory(), f"{request.test_plan_id}.json")
+    if not await anyio.to_thread.run_sync(os.path.exists, test_plan_path):
+        raise HTTPException(status_code=404, detail="Test plan not found")
+    
+    cmd = execution_manager.build_command(test_plan_path, request.debug_level or 0)
+    
+    try:
+        # Run the blocking subprocess in a worker thread so the event loop keeps
+        # serving other requests (and other executions) meanwhile
+        process = await anyio.to_thread.run_sync(functools.partial(
+            subprocess.run, cmd, capture_output=True, text=True, cwd=PROJECT_ROOT,
+            timeout=REST_EXECUTION_TIMEOUT
+        ))
+    except subprocess.TimeoutExpired as e:
+        # subprocess.run killed the test process
+        return {
+            "message": f"Test execution timed out after {REST_EXECUTION_TIMEOUT} seconds",
+            "test_plan_id": request.test_plan_id,
+            "debug_level": request.debug_level,
+            "status": "FAILED",
+            "returncode": None,
+            "stdout": timeout_output_text(e.stdout),
+            "stderr": timeout_output_text(e.stderr)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error executing test plan: {str(e)}")
+    
     return {
-        "message": "Test execution endpoint - will integrate with existing framework",
+        "message": "Test execution finished",
         "test_plan_id": request.test_plan_id,
         "debug_level": request.debug_level,
-        "status": "pending"
+        "status": "COMPLETED" if process.returncode == 0 else "FAILED",
+        "returncode": process.returncode,
+        "stdout": process.stdout,
+        "stderr": process.stderr
     }
 
 @app.websocket("/ws/test-execution")
@@ -693,12 +1091,12 @@ async def websocket_test_execution(websocket: WebSocket):
     
     try:
         # Wait for execution request
-        data = await websocket.receive_json()
+        data = await receive_message(websocket)
         test_plan_id = data.get("test_plan_id")
         debug_level = data.get("debug_level", 0)
         
         if not test_plan_id:
-            await websocket.send_json({
+            await send_message(websocket, {
                 "type": "ERROR",
                 "message": "test_plan_id is required"
             })
@@ -707,14 +1105,31 @@ async def websocket_test_execution(websocket: WebSocket):
         # Execute the test plan
         await execution_manager.execute_test_plan(test_plan_id, websocket, debug_level)
         
-    except WebSocketDisconnect:
+    except (WebSocketDisconnect, StreamClosed):
         print("WebSocket disconnected")
     except Exception as e:
-        await websocket.send_json({
+        await send_message(websocket, {
             "type": "ERROR",
             "message": f"WebSocket error: {str(e)}"
         })
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # C-accelerated event loop and HTTP parser, both installed by uvicorn[standard]
+    # (uvloop does not support Windows, which keeps the asyncio loop).
+    # One worker process per CPU; the app must be passed as an import string for
+    # that. All in-memory caches are revalidated against the file mtime and size, so the
+    # workers see each other's writes. Windows stays on a single worker: uvicorn
+    # switches multi-process servers to the selector loop there, which has no
+    # asyncio subprocess support (test executions would fall back to pipe threads).
+    uvicorn.run(
+        "main:app",
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host="0.0.0.0",
+        port=8000,
+        workers=1 if sys.platform == "win32" else max(2, os.cpu_count() or 1),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # No per-request access log lines: only warnings and errors are logged
+        log_level="warning"
+    )
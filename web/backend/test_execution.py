@@ -6,83 +6,197 @@ Handles real-time execution of test plans with WebSocket support for live output
 
 import os
 import sys
-import json
+import anyio
 import asyncio
+import locale
+import logging
+import orjson
+import re
 import subprocess
+import threading
+import time
 import uuid
 from datetime import datetime
 from typing import Dict, Optional
 from fastapi import WebSocket, WebSocketDisconnect
 
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+TEST_PLANS_DIR = os.path.join(PROJECT_ROOT, 'test_plans')
+MAIN_SCRIPT = os.path.join(PROJECT_ROOT, 'main.py')
+
 # Add parent directory to path to import existing framework modules
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(PROJECT_ROOT)
+
+logger = logging.getLogger(__name__)
+
+# Most output lines sent in a single OUTPUT_BATCH message
+MAX_OUTPUT_BATCH = 500
+
+# Most output lines waiting to be sent per execution: past it the stream readers wait
+# for the sender, and a child writing faster than the client reads blocks on its pipes
+MAX_QUEUED_OUTPUT = 10000
+
+# Size of the reads on the test execution output pipes
+OUTPUT_READ_SIZE = 65536
+
+# Encoding of the test execution output: the child writes to pipes with the locale encoding
+OUTPUT_ENCODING = locale.getpreferredencoding(False)
+
+# Line breaks of the test execution output: universal newlines, as text-mode pipes
+# (str.splitlines() would also split on form feeds, \x1c-\x1e, \x85, \u2028...)
+OUTPUT_LINE_BREAK_RE = re.compile(r'\r\n|\r|\n')
+
+class StreamClosed(Exception):
+    """Raised when sending a message on a WebSocket that is no longer open."""
+
+async def send_message(websocket: WebSocket, message: dict):
+    """Send a JSON message as a text frame, encoded with orjson instead of the json module."""
+    try:
+        await websocket.send_text(orjson.dumps(message).decode())
+    except (WebSocketDisconnect, RuntimeError, OSError) as e:
+        # Depending on the Starlette and uvicorn versions, sending on a closed
+        # connection raises one of these
+        raise StreamClosed(f"WebSocket closed: {e!r}") from e
+
+async def receive_message(websocket: WebSocket) -> dict:
+    """Receive a JSON message sent as a text frame, decoded with orjson."""
+    return orjson.loads(await websocket.receive_text())
+
+class ThreadedProcess:
+    """
+    The part of asyncio.subprocess.Process used here, over subprocess.Popen, for event loops
+    without subprocess support (uvicorn runs the selector loop on Windows with --reload or
+    several workers). A daemon thread per pipe feeds its output to an asyncio.StreamReader.
+    """
+    
+    def __init__(self, process: subprocess.Popen, loop: asyncio.AbstractEventLoop):
+        self._process = process
+        self.pid = process.pid
+        self.stdout = self._pipe_reader(process.stdout, loop)
+        self.stderr = self._pipe_reader(process.stderr, loop)
+    
+    @staticmethod
+    def _pipe_reader(pipe, loop: asyncio.AbstractEventLoop) -> asyncio.StreamReader:
+        """Start pumping a pipe into a new StreamReader."""
+        reader = asyncio.StreamReader(limit=OUTPUT_READ_SIZE, loop=loop)
+        
+        def pump():
+            with pipe:
+                for chunk in iter(lambda: pipe.read1(OUTPUT_READ_SIZE), b''):
+                    loop.call_soon_threadsafe(reader.feed_data, chunk)
+            loop.call_soon_threadsafe(reader.feed_eof)
+        
+        threading.Thread(target=pump, daemon=True).start()
+        return reader
+    
+    @property
+    def returncode(self) -> Optional[int]:
+        return self._process.poll()
+    
+    def terminate(self):
+        self._process.terminate()
+    
+    async def wait(self) -> int:
+        return await asyncio.get_running_loop().run_in_executor(None, self._process.wait)
+
+async def start_process(cmd: list, cwd: str):
+    """
+    Start a process with piped stdout/stderr read as asyncio streams: no thread per
+    output line, the pipes are watched by the event loop itself. On the uvloop loop
+    main.py runs the server with, libuv spawns the process and polls its pipes. The
+    ThreadedProcess fallback is only for loops without subprocess support (Windows).
+    """
+    try:
+        return await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            limit=OUTPUT_READ_SIZE
+        )
+    except NotImplementedError:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd)
+        return ThreadedProcess(process, asyncio.get_running_loop())
+
+class ExecutionRecord:
+    """Everything held for one execution, kept together under its execution ID."""
+    
+    __slots__ = ('test_plan_id', 'websocket', 'queue', 'start_time', 'process')
+    
+    def __init__(self, test_plan_id: str, websocket: WebSocket):
+        self.test_plan_id = test_plan_id
+        self.websocket = websocket
+        # Output lines waiting to be sent, fed by the stream readers
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUED_OUTPUT)
+        self.start_time = time.time()
+        # Set once the process is started
+        self.process: Optional[asyncio.subprocess.Process] = None
 
 class TestExecutionManager:
     """Manages test plan executions and WebSocket connections."""
     
     def __init__(self):
-        self.active_executions: Dict[str, subprocess.Popen] = {}
-        self.websocket_connections: Dict[str, WebSocket] = {}
+        self.executions: Dict[str, ExecutionRecord] = {}
     
     async def execute_test_plan(self, test_plan_id: str, websocket: WebSocket, debug_level: int = 0):
         """Execute a test plan and stream output via WebSocket."""
         execution_id = str(uuid.uuid4())
         
         try:
-            # Register WebSocket connection
-            self.websocket_connections[execution_id] = websocket
+            # Register the execution and its WebSocket connection
+            record = self.executions[execution_id] = ExecutionRecord(test_plan_id, websocket)
             
             # Get test plan file path
             test_plan_path = self._get_test_plan_path(test_plan_id)
-            if not os.path.exists(test_plan_path):
+            
+            # Read the test plan name once, off the event loop (also checks the plan exists);
+            # it is needed again for the execution log filename
+            try:
+                test_plan_name = await anyio.to_thread.run_sync(
+                    self._read_test_plan_name, test_plan_path, test_plan_id
+                )
+            except FileNotFoundError:
                 await self._send_error(websocket, f"Test plan not found: {test_plan_id}")
                 return
             
             # Build command
-            cmd = self._build_command(test_plan_path, debug_level)
-            
-            # Get project root directory
-            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-            
-            # Start execution
-            await self._send_status(websocket, "STARTING", f"Starting execution of {test_plan_id}")
+            cmd = self.build_command(test_plan_path, debug_level)
             
             # Execute the test plan from project root
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
-                cwd=project_root  # Execute from project root
-            )
+            process = record.process = await start_process(cmd, PROJECT_ROOT)
             
-            self.active_executions[execution_id] = process
-            
-            await self._send_status(websocket, "RUNNING", "Test execution in progress")
+            # A single status once the process is started
+            await self._send_status(websocket, "RUNNING", f"Starting execution of {test_plan_id}",
+                                    pid=process.pid)
             
             # Stream output in real-time
-            await self._stream_output(process, websocket, execution_id)
+            await self._stream_output(record)
             
             # Wait for completion
-            return_code = process.wait()
+            return_code = await process.wait()
             
             # Generate execution log
-            log_filename = await self._generate_execution_log(
-                test_plan_id, execution_id, return_code
+            log_filename = self._generate_execution_log(
+                test_plan_name, execution_id, return_code
             )
             
+            # The final status carries the execution log link
+            log = {
+                "filename": log_filename,
+                "url": f"http://localhost:3000/#/execution-logs/{log_filename}"
+            }
             if return_code == 0:
                 await self._send_status(websocket, "COMPLETED", 
-                                      f"Execution completed successfully. Log: {log_filename}")
-                await self._send_execution_log_link(websocket, log_filename)
+                                      f"Execution completed successfully. Log: {log_filename}", log=log)
             else:
                 await self._send_status(websocket, "FAILED", 
-                                      f"Execution failed with return code {return_code}. Log: {log_filename}")
-                await self._send_execution_log_link(websocket, log_filename)
+                                      f"Execution failed with return code {return_code}. Log: {log_filename}", log=log)
                 
+        except StreamClosed:
+            # Nobody is left to report to: stop the execution
+            logger.info("WebSocket closed during execution %s of %s", execution_id, test_plan_id)
         except Exception as e:
+            logger.exception("Execution %s of %s failed", execution_id, test_plan_id)
             await self._send_error(websocket, f"Execution error: {str(e)}")
         finally:
             # Cleanup
@@ -90,65 +204,104 @@ class TestExecutionManager:
     
     def _get_test_plan_path(self, test_plan_id: str) -> str:
         """Get the full path to a test plan file."""
-        test_plans_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'test_plans')
-        return os.path.join(test_plans_dir, f"{test_plan_id}.json")
+        return os.path.join(TEST_PLANS_DIR, f"{test_plan_id}.json")
     
-    def _build_command(self, test_plan_path: str, debug_level: int) -> list:
+    def build_command(self, test_plan_path: str, debug_level: int) -> list:
         """Build the command to execute main.py."""
-        # Use absolute path to main.py from the project root
-        project_root = os.path.join(os.path.dirname(__file__), '..', '..')
-        main_script = os.path.abspath(os.path.join(project_root, 'main.py'))
-        
         # Use unbuffered output for real-time streaming
-        cmd = [sys.executable, '-u', main_script, test_plan_path]
-        
         if debug_level > 0:
-            cmd.extend(['-d', str(debug_level)])
-        
-        return cmd
+            return [sys.executable, '-u', MAIN_SCRIPT, test_plan_path, '-d', str(debug_level)]
+        return [sys.executable, '-u', MAIN_SCRIPT, test_plan_path]
     
-    async def _stream_output(self, process: subprocess.Popen, websocket: WebSocket, execution_id: str):
+    async def _stream_output(self, record: ExecutionRecord):
         """Stream stdout and stderr output via WebSocket in real-time."""
+        # Both stream readers feed the execution queue, drained by a single sender that
+        # packs every line already available into one message
+        process, websocket, queue = record.process, record.websocket, record.queue
         try:
-            # Create tasks for reading stdout and stderr concurrently
-            stdout_task = asyncio.create_task(
-                self._read_stream(process.stdout, websocket, "STDOUT")
-            )
-            stderr_task = asyncio.create_task(
-                self._read_stream(process.stderr, websocket, "STDERR")
-            )
-            
-            # Wait for both streams to complete
-            await asyncio.gather(stdout_task, stderr_task)
+            # Task groups: a task that fails cancels its siblings (e.g. the readers stop
+            # when the WebSocket is gone) and its error is raised here
+            async with anyio.create_task_group() as streaming:
+                streaming.start_soon(self._send_queued_output, websocket, queue)
+                
+                # Read stdout and stderr concurrently until both are closed,
+                # then let the sender flush the last lines
+                async with anyio.create_task_group() as readers:
+                    readers.start_soon(self._read_stream, process.stdout, queue, "STDOUT")
+                    readers.start_soon(self._read_stream, process.stderr, queue, "STDERR")
+                await queue.put(None)
                     
         except Exception as e:
+            # Handle the error that stopped the streaming, not the group wrapping it
+            while getattr(e, 'exceptions', None):
+                e = e.exceptions[0]
+            if isinstance(e, StreamClosed):
+                raise e
+            logger.exception("Output streaming error", exc_info=e)
             await self._send_error(websocket, f"Output streaming error: {str(e)}")
     
-    async def _read_stream(self, stream, websocket: WebSocket, stream_type: str):
-        """Read from a stream and send output via WebSocket."""
-        try:
-            while True:
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, stream.readline
-                )
-                if not line:
-                    break
-                
+    async def _read_stream(self, stream: asyncio.StreamReader, queue: asyncio.Queue, stream_type: str):
+        """
+        Read from a stream and queue its output lines for sending. A read error is not
+        caught here: it stops the streaming task group, which reports it.
+        """
+        # Read whatever is available, up to a large chunk, and split it here rather
+        # than awaiting each line; a trailing partial line waits for the next chunk
+        pending = b''
+        while True:
+            chunk = await stream.read(OUTPUT_READ_SIZE)
+            if chunk:
+                data = pending + chunk
+                # A bare \r ends a line too (progress updates): deliver it right away
+                end = max(data.rfind(b'\n'), data.rfind(b'\r')) + 1
+                complete, pending = data[:end], data[end:]
+            else:
+                # End of stream: flush a last line that has no newline
+                complete, pending = pending, b''
+            
+            # Complete lines end on a line break byte, so no character is cut in two.
+            # A \r\n split across two chunks only yields an empty line, which is skipped
+            for line in OUTPUT_LINE_BREAK_RE.split(complete.decode(OUTPUT_ENCODING, errors='replace')):
                 line = line.rstrip()
                 if line:  # Only send non-empty lines
-                    await self._send_output(websocket, stream_type, line)
-                    
-        except Exception as e:
-            print(f"Error reading {stream_type}: {e}")
+                    # Queued in its final message form, sent as is by the sender
+                    await queue.put({"stream": stream_type, "line": line})
+            
+            if not chunk:
+                break
     
-    async def _generate_execution_log(self, test_plan_id: str, execution_id: str, return_code: int) -> str:
+    async def _send_queued_output(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Send queued output lines until the None end marker, batching the lines available at once."""
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            
+            # Drain whatever else is already queued (lines produced while the previous
+            # batch was being sent) into the same message
+            batch = [item]
+            finished = False
+            while len(batch) < MAX_OUTPUT_BATCH:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    finished = True
+                    break
+                batch.append(item)
+            
+            await self._send_output_batch(websocket, batch)
+            if finished:
+                return
+    
+    def _read_test_plan_name(self, test_plan_path: str, test_plan_id: str) -> str:
+        """Read the name of a test plan, defaulting to its ID (blocking, run it in a worker thread)."""
+        with open(test_plan_path, 'rb') as f:
+            return orjson.loads(f.read()).get('name', test_plan_id)
+    
+    def _generate_execution_log(self, test_plan_name: str, execution_id: str, return_code: int) -> str:
         """Generate execution log file with consistent naming."""
-        # Get test plan name for filename
-        test_plan_path = self._get_test_plan_path(test_plan_id)
-        with open(test_plan_path, 'r') as f:
-            test_plan_data = json.load(f)
-            test_plan_name = test_plan_data.get('name', test_plan_id)
-        
         # Replace all spaces with underscores in test plan name
         test_plan_name_clean = test_plan_name.replace(' ', '_')
         
@@ -161,59 +314,42 @@ class TestExecutionManager:
         
         return filename
     
-    async def _send_status(self, websocket: WebSocket, status: str, message: str):
-        """Send execution status update."""
-        await websocket.send_json({
+    async def _send_status(self, websocket: WebSocket, status: str, message: str, **fields):
+        """Send execution status update, with any extra fields given."""
+        await send_message(websocket, {
             "type": "STATUS",
             "status": status,
             "message": message,
+            **fields,
             "timestamp": datetime.now().isoformat()
         })
     
-    async def _send_output(self, websocket: WebSocket, stream_type: str, line: str):
-        """Send output line."""
-        await websocket.send_json({
-            "type": "OUTPUT",
-            "stream": stream_type,
-            "line": line,
-            "timestamp": datetime.now().isoformat()
+    async def _send_output_batch(self, websocket: WebSocket, batch: list):
+        """Send a batch of {"stream", "line"} output lines."""
+        await send_message(websocket, {
+            "type": "OUTPUT_BATCH",
+            "lines": batch,
+            # Epoch seconds: no datetime object nor ISO formatting on the output path
+            "ts": time.time()
         })
     
     async def _send_error(self, websocket: WebSocket, error_message: str):
         """Send error message."""
-        await websocket.send_json({
+        await send_message(websocket, {
             "type": "ERROR",
             "message": error_message,
             "timestamp": datetime.now().isoformat()
         })
     
-    async def _send_execution_log_link(self, websocket: WebSocket, log_filename: str):
-        """Send execution log link."""
-        await websocket.send_json({
-            "type": "LOG_LINK",
-            "url": f"http://localhost:3000/#/execution-logs/{log_filename}",
-            "filename": log_filename,
-            "timestamp": datetime.now().isoformat()
-        })
-    
     def _cleanup_execution(self, execution_id: str):
         """Clean up execution resources."""
-        if execution_id in self.active_executions:
-            process = self.active_executions[execution_id]
-            if process.poll() is None:
-                process.terminate()
-            del self.active_executions[execution_id]
-        
-        if execution_id in self.websocket_connections:
-            del self.websocket_connections[execution_id]
+        record = self.executions.pop(execution_id, None)
+        if record is not None and record.process is not None and record.process.returncode is None:
+            record.process.terminate()
     
     def stop_execution(self, execution_id: str):
         """Stop a running execution."""
-        if execution_id in self.active_executions:
-            process = self.active_executions[execution_id]
-            if process.poll() is None:
-                process.terminate()
-            self._cleanup_execution(execution_id)
+        self._cleanup_execution(execution_id)
 
 
 # Global instance